@@ -8,10 +8,17 @@ import os
 import re
 import argparse
 import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Tuple
-import statistics
+from typing import List, Dict, Tuple, Optional
+
+try:
+    import orjson  # Opțional - serializează dataclass-urile direct, mult mai rapid
+except ImportError:
+    orjson = None
 
 @dataclass
 class FileMetrics:
@@ -37,166 +44,187 @@ class ProjectMetrics:
     files_metrics: List[FileMetrics]
 
 class CodeComplexityAnalyzer:
+    # Intervalul minim (secunde) între două mesaje de progres
+    PROGRESS_INTERVAL = 0.1
+    
     def __init__(self):
+        # Fișierele sunt analizate ca bytes (sursele Arduino sunt practic ASCII),
+        # deci toate pattern-urile sunt bytes - fără decodare UTF-8 la citire
+        
         # Regex patterns pentru detectarea structurilor de control
         self.control_structures = [
-            r'\bif\s*\(',
-            r'\belse\s+if\s*\(',
-            r'\bwhile\s*\(',
-            r'\bfor\s*\(',
-            r'\bdo\s*\{',
-            r'\bswitch\s*\(',
-            r'\bcase\s+',
-            r'\bcatch\s*\(',
-            r'\?\s*.*\s*:',  # ternary operator
+            rb'if\s*\(',
+            rb'else\s+(?=if\s*\()',  # else if - "if (" se numără separat
+            rb'while\s*\(',
+            rb'for\s*\(',
+            rb'do\s*\{',
+            rb'switch\s*\(',
+            rb'case\s+',
+            rb'catch\s*\(',
         ]
+        self.ternary_pattern = rb'\?[^?:;\n]*:'  # fără backtracking pe liniile lungi
+        
+        # Toate pattern-urile într-o singură trecere precompilată. Lookahead-ul cu
+        # primele caractere posibile lasă motorul să sară rapid peste restul
+        # textului, iar \b se verifică o dată, nu pentru fiecare alternativă.
+        first_chars = bytes(sorted({p[0] for p in self.control_structures}))
+        keywords = b'|'.join(self.control_structures)
+        self._RE_CC = re.compile(
+            rb'(?=[?%s])(?:\b(?:%s)|%s)' % (first_chars, keywords, self.ternary_pattern),
+            re.IGNORECASE
+        )
+        
+        # Pattern pentru funcții - antetul și acolada de deschidere pe aceeași linie.
+        # Se caută în tot fișierul (MULTILINE), deci spațiile nu trec peste '\n'.
+        # Repetările sunt limitate, iar lista de parametri se oprește la prima
+        # acoladă, ca o linie lungă (macro-uri) să nu provoace backtracking excesiv.
+        self.function_pattern = rb'^[ \t]*(?:(?:inline|static|virtual|explicit|const)[ \t]+){0,8}(?:\w+(?:[ \t]*[*&])?(?:[ \t]*const)?[ \t]+){1,8}(\w+)[ \t]*\([^;\n{}]{0,500}\)[ \t]*(?:const[ \t]*)?(?:override[ \t]*)?(?:final[ \t]*)?\{'
+        self._RE_FUNC = re.compile(self.function_pattern, re.MULTILINE)
+        self._RE_BRACE = re.compile(rb'[{}]')
+        
+        # Directoare care nu conțin sursele proiectului (cache-ul și build-ul
+        # PlatformIO, setările editorului) - nu se parcurg la căutarea fișierelor
+        self.skip_dirs = {'.pio', '.git', '.vscode', 'build', '.cache'}
+        
+        # Pattern-uri pentru comentarii și string-uri. /* */ nu se imbrică în C/C++,
+        # deci varianta non-greedy e sigură; un comentariu neînchis ține până la final.
+        self._RE_BLOCK = re.compile(rb'/\*.*?(?:\*/|\Z)', re.DOTALL)
+        self._RE_LINE = re.compile(rb'//[^\n]*')
+        self._RE_STR = re.compile(rb'"(?:[^"\\\n]|\\.)*"')
+        self._RE_CHR = re.compile(rb"'(?:[^'\\\n]|\\.)*'")
+        
+        # O singură alternare, ca primul token găsit să câștige
+        # (ex. "//" într-un string nu e comentariu)
+        self._RE_TOKEN = re.compile(
+            b'|'.join(p.pattern for p in (self._RE_BLOCK, self._RE_LINE, self._RE_STR, self._RE_CHR)),
+            re.DOTALL
+        )
+        
+    @staticmethod
+    def _strip_token(match) -> bytes:
+        """Înlocuiește un string cu "" și un comentariu cu liniile noi pe care le conține"""
+        token = match.group()
+        quote = token[:1]
+        # Și string-urile pot conține '\n' (continuare de linie cu '\'), care se
+        # păstrează ca liniile curățate să rămână aliniate cu originalul
+        newlines = b'\n' * token.count(b'\n')
+        if quote in (b'"', b"'"):
+            return quote * 2 + newlines
+        return newlines
+    
+    def remove_comments_and_strings(self, content: bytes) -> bytes:
+        """Elimină comentariile și string-urile din cod, păstrând numărul de linii"""
+        # Fără '/', '"' sau '\'' nu există nimic de eliminat - verificările sunt
+        # căutări în C, mult mai ieftine decât regex-ul
+        if b'/' not in content and b'"' not in content and b"'" not in content:
+            return content
+        return self._RE_TOKEN.sub(self._strip_token, content)
+    
+    def _scan(self, content: bytes) -> Tuple[int, int, int, bytes]:
+        """Contorizează liniile și elimină comentariile/string-urile într-o singură trecere
+        
+        Returnează (loc, comentarii, linii goale, conținut curățat). Conținutul curățat
+        păstrează toate liniile, deci linia i din original corespunde liniei i curățate.
+        """
+        cleaned = self.remove_comments_and_strings(content)
         
-        # Pattern pentru funcții
-        self.function_pattern = r'^\s*(?:(?:inline|static|virtual|explicit|const)\s+)*(?:\w+(?:\s*\*|\s*&)?(?:\s*const)?\s+)+(\w+)\s*\([^;]*\)\s*(?:const\s*)?(?:override\s*)?(?:final\s*)?\s*\{'
-        
-        # Pattern pentru comentarii
-        self.single_comment = r'//.*$'
-        self.multi_comment_start = r'/\*'
-        self.multi_comment_end = r'\*/'
-        
-    def remove_comments_and_strings(self, content: str) -> str:
-        """Elimină comentariile și string-urile din cod pentru analiză mai precisă"""
-        # Elimină string-urile
-        content = re.sub(r'"(?:[^"\\]|\\.)*"', '""', content)
-        content = re.sub(r"'(?:[^'\\]|\\.)*'", "''", content)
-        
-        # Elimină comentariile single-line
-        content = re.sub(self.single_comment, '', content, flags=re.MULTILINE)
-        
-        # Elimină comentariile multi-line
-        while True:
-            match = re.search(self.multi_comment_start, content)
-            if not match:
-                break
-            start = match.start()
-            end_match = re.search(self.multi_comment_end, content[start:])
-            if end_match:
-                end = start + end_match.end()
-                content = content[:start] + content[end:]
+        lines = content.split(b'\n')
+        clean_lines = cleaned.split(b'\n')
+        if lines[-1] == b'':
+            # Ultimul '\n' nu începe o linie nouă
+            lines.pop()
+            clean_lines.pop()
+        
+        loc = 0
+        comments = 0
+        blank = 0
+        for line, clean_line in zip(lines, clean_lines):
+            # Liniile de cod sunt majoritare: o linie care rămâne ne-goală după
+            # curățare e cod, deci originalul nu mai trebuie verificat
+            if clean_line.strip():
+                loc += 1
+            elif line.strip():
+                comments += 1
             else:
-                content = content[:start]
-                break
+                blank += 1
                 
-        return content
+        return loc, comments, blank, cleaned
     
     def count_lines(self, filepath: str) -> Tuple[int, int, int]:
         """Contorizează liniile de cod, comentarii și linii goale"""
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
+            with open(filepath, 'rb') as f:
+                content = f.read()
         except Exception as e:
             print(f"Eroare la citirea fișierului {filepath}: {e}")
             return 0, 0, 0
             
-        loc = 0
-        comments = 0
-        blank = 0
-        in_multiline_comment = False
-        
-        for line in lines:
-            line = line.strip()
-            
-            if not line:
-                blank += 1
-                continue
-                
-            # Verifică comentarii multi-line
-            if '/*' in line and '*/' in line:
-                # Comentariu pe o singură linie
-                if not re.match(r'^\s*/\*.*\*/\s*$', line):
-                    loc += 1
-                else:
-                    comments += 1
-                continue
-            elif '/*' in line:
-                in_multiline_comment = True
-                comments += 1
-                continue
-            elif '*/' in line:
-                in_multiline_comment = False
-                comments += 1
-                continue
-            elif in_multiline_comment:
-                comments += 1
-                continue
-                
-            # Verifică comentarii single-line
-            if line.startswith('//'):
-                comments += 1
-            else:
-                loc += 1
-                
+        loc, comments, blank, _ = self._scan(content)
         return loc, comments, blank
     
-    def calculate_cyclomatic_complexity(self, content: str) -> int:
-        """Calculează complexitatea ciclomatică McCabe"""
-        content = self.remove_comments_and_strings(content)
-        complexity = 1  # Complexitatea de bază
+    def calculate_cyclomatic_complexity(self, content: bytes) -> int:
+        """Calculează complexitatea ciclomatică McCabe (conținut fără comentarii/string-uri)"""
+        # Complexitatea de bază + un punct de decizie pentru fiecare structură de control
+        return 1 + len(self._RE_CC.findall(content))
+    
+    def _match_braces(self, content: bytes) -> Tuple[Dict[int, int], int]:
+        """Împerechează acoladele într-o singură trecere (conținut fără comentarii/string-uri)
         
-        for pattern in self.control_structures:
-            matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-            complexity += len(matches)
-            
-        return complexity
+        Returnează (poziția fiecărei acolade deschise -> poziția celei care o închide,
+        adâncimea maximă de imbricare). Acoladele închise în plus sunt ignorate.
+        """
+        pairs = {}
+        stack = []
+        max_depth = 0
+        open_brace = ord('{')
+        
+        for brace in self._RE_BRACE.finditer(content):
+            pos = brace.start()
+            if content[pos] == open_brace:
+                stack.append(pos)
+                if len(stack) > max_depth:
+                    max_depth = len(stack)
+            elif stack:
+                pairs[stack.pop()] = pos
+                
+        return pairs, max_depth
     
-    def find_functions(self, content: str) -> List[Tuple[str, int, int]]:
-        """Găsește funcțiile și calculează complexitatea fiecăreia"""
-        content_clean = self.remove_comments_and_strings(content)
+    def find_functions(self, content: bytes, brace_pairs: Optional[Dict[int, int]] = None) -> List[Tuple[str, int, int]]:
+        """Găsește funcțiile și calculează complexitatea fiecăreia (conținut fără comentarii/string-uri)"""
+        if brace_pairs is None:
+            brace_pairs, _ = self._match_braces(content)
+            
         functions = []
+        function_end = 0
         
-        lines = content_clean.split('\n')
-        current_function = None
-        brace_count = 0
-        function_content = []
-        
-        for i, line in enumerate(lines):
-            # Caută începutul unei funcții
-            func_match = re.search(self.function_pattern, line)
-            if func_match and current_function is None:
-                current_function = func_match.group(1)
-                function_content = [line]
-                brace_count = line.count('{') - line.count('}')
-                continue
-                
-            if current_function is not None:
-                function_content.append(line)
-                brace_count += line.count('{') - line.count('}')
-                
-                if brace_count <= 0:
-                    # Sfârșitul funcției
-                    func_code = '\n'.join(function_content)
-                    complexity = self.calculate_cyclomatic_complexity(func_code)
-                    functions.append((current_function, complexity, len(function_content)))
-                    current_function = None
-                    function_content = []
-                    brace_count = 0
+        for func_match in self._RE_FUNC.finditer(content):
+            if func_match.start() < function_end:
+                continue  # Antet în interiorul funcției anterioare
+            
+            # Acolada care închide corpul funcției
+            close_pos = brace_pairs.get(func_match.end() - 1)
+            if close_pos is None:
+                break  # Corpul nu se închide până la sfârșitul fișierului
+            
+            # Funcția ține până la sfârșitul liniei cu acolada de închidere
+            function_end = content.find(b'\n', close_pos)
+            if function_end == -1:
+                function_end = len(content)
+            
+            func_code = content[func_match.start():function_end]
+            complexity = self.calculate_cyclomatic_complexity(func_code)
+            functions.append((func_match.group(1).decode('ascii'), complexity, func_code.count(b'\n') + 1))
                     
         return functions
     
-    def calculate_nesting_depth(self, content: str) -> int:
-        """Calculează adâncimea maximă de imbricare"""
-        content = self.remove_comments_and_strings(content)
-        max_depth = 0
-        current_depth = 0
-        
-        for char in content:
-            if char == '{':
-                current_depth += 1
-                max_depth = max(max_depth, current_depth)
-            elif char == '}':
-                current_depth = max(0, current_depth - 1)
-                
-        return max_depth
+    def calculate_nesting_depth(self, content: bytes) -> int:
+        """Calculează adâncimea maximă de imbricare (conținut fără comentarii/string-uri)"""
+        return self._match_braces(content)[1]
     
     def analyze_file(self, filepath: str) -> FileMetrics:
         """Analizează un singur fișier"""
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            with open(filepath, 'rb') as f:
                 content = f.read()
         except Exception as e:
             print(f"Eroare la citirea fișierului {filepath}: {e}")
@@ -208,17 +236,18 @@ class CodeComplexityAnalyzer:
                 nested_depth=0
             )
         
-        # Calculează metricile
-        loc, comments, blank = self.count_lines(filepath)
-        file_complexity = self.calculate_cyclomatic_complexity(content)
-        functions = self.find_functions(content)
-        nesting_depth = self.calculate_nesting_depth(content)
+        # Calculează metricile - fișierul e citit și curățat o singură dată
+        loc, comments, blank, content_clean = self._scan(content)
+        file_complexity = self.calculate_cyclomatic_complexity(content_clean)
+        # Acoladele sunt împerecheate o dată, pentru corpurile funcțiilor și imbricare
+        brace_pairs, nesting_depth = self._match_braces(content_clean)
+        functions = self.find_functions(content_clean, brace_pairs)
         
         # Calculează statisticile funcțiilor
         if functions:
             function_complexities = [f[1] for f in functions]
             max_func_complexity = max(function_complexities)
-            avg_func_complexity = statistics.mean(function_complexities)
+            avg_func_complexity = sum(function_complexities) / len(function_complexities)
         else:
             max_func_complexity = 0
             avg_func_complexity = 0
@@ -235,28 +264,113 @@ class CodeComplexityAnalyzer:
             nested_depth=nesting_depth
         )
     
-    def analyze_project(self, project_path: str) -> ProjectMetrics:
-        """Analizează întreg proiectul PlatformIO"""
+    def _find_sources(self, directory: str, extensions: set, recursive: bool = True):
+        """Generează căile fișierelor cu extensiile date, într-o singură parcurgere os.scandir"""
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return  # Director inaccesibil - ignorat, ca la rglob
+        
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive and entry.name not in self.skip_dirs:
+                    yield from self._find_sources(entry.path, extensions)
+            elif os.path.splitext(entry.name)[1].lower() in extensions:
+                yield Path(entry.path)
+    
+    @staticmethod
+    def _file_size(filepath: Path) -> int:
+        """Mărimea fișierului, 0 dacă nu poate fi interogat (ex. symlink invalid) -
+        eroarea se raportează apoi la citire, ca pentru orice fișier ilizibil"""
+        try:
+            return filepath.stat().st_size
+        except OSError:
+            return 0
+    
+    def _analyze_files(self, files: List[Path], jobs: Optional[int] = None) -> List[FileMetrics]:
+        """Analizează fișierele date, serial sau în paralel"""
+        workers = jobs or os.cpu_count() or 1
+        paths = [str(filepath) for filepath in files]
+        
+        if workers == 1 or len(paths) == 1:
+            # Serial - evită costul pornirii pool-ului de procese
+            return self._collect_results(map(self.analyze_file, paths), len(paths))
+        
+        # Fișierele sunt independente, deci se analizează în paralel. Fiecare
+        # proces liber primește următorul fișier (chunksize=1), iar cum lista
+        # e sortată descrescător după mărime, cele mari nu rămân la final.
+        # Fiecare proces își construiește un singur analizor (pattern-urile
+        # compilate), în loc să primească unul serializat la fiecare fișier.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            return self._collect_results(executor.map(_analyze_one, paths, chunksize=1), len(paths))
+    
+    def _collect_results(self, results, total: int) -> List[FileMetrics]:
+        """Adună rezultatele, afișând progresul cel mult o dată la PROGRESS_INTERVAL secunde"""
+        files_metrics = []
+        last_report = time.monotonic()
+        
+        for metrics in results:
+            files_metrics.append(metrics)
+            now = time.monotonic()
+            if now - last_report >= self.PROGRESS_INTERVAL or len(files_metrics) == total:
+                print(f"Analizat: {len(files_metrics)}/{total} fișiere")
+                last_report = now
+                
+        return files_metrics
+    
+    def _load_cache(self, cache_file: str) -> dict:
+        """Încarcă rezultatele salvate la rularea anterioară"""
+        if not os.path.exists(cache_file):
+            return {}
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Eroare la citirea cache-ului {cache_file}: {e}")
+            return {}
+    
+    def _save_cache(self, cache_file: str, cache: dict):
+        """Salvează rezultatele pentru rularea următoare"""
+        try:
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"Eroare la salvarea cache-ului {cache_file}: {e}")
+    
+    def analyze_project(self, project_path: str, jobs: Optional[int] = None,
+                        cache_file: Optional[str] = None) -> ProjectMetrics:
+        """Analizează întreg proiectul PlatformIO
+
+        jobs: numărul de procese folosite pentru analiză (None = toate nucleele, 1 = serial)
+        cache_file: fișier JSON cu rezultatele anterioare; fișierele nemodificate nu se reanalizează
+        """
         project_path = Path(project_path)
         
         # Găsește fișierele C/C++ și header
         cpp_extensions = ['.cpp', '.c', '.cc', '.cxx', '.ino']
         header_extensions = ['.h', '.hpp', '.hxx']
-        all_extensions = cpp_extensions + header_extensions
+        all_extensions = set(cpp_extensions + header_extensions)
         
         files_to_analyze = []
         
-        # Caută în directorul src/ și în rădăcina proiectului
-        search_dirs = ['src', 'lib', 'include', '.']
+        # Caută recursiv în directoarele PlatformIO; din rădăcină se iau doar
+        # fișierele de pe primul nivel (ex. sketch-ul .ino), altfel rădăcina ar
+        # reparcurge src/, lib/ și include/. Un proiect fără aceste directoare
+        # (structura Arduino IDE) se parcurge recursiv din rădăcină.
+        search_dirs = [project_path / d for d in ('src', 'lib', 'include')]
+        search_dirs = [d for d in search_dirs if d.is_dir()]
+        
+        for dir_path in search_dirs:
+            files_to_analyze.extend(self._find_sources(dir_path, all_extensions))
         
-        for search_dir in search_dirs:
-            dir_path = project_path / search_dir
-            if dir_path.exists():
-                for ext in all_extensions:
-                    files_to_analyze.extend(dir_path.rglob(f'*{ext}'))
+        files_to_analyze.extend(self._find_sources(project_path, all_extensions, recursive=not search_dirs))
         
-        # Elimină duplicatele
-        files_to_analyze = list(set(files_to_analyze))
+        # Elimină duplicatele după calea reală (symlink-uri, căi relative),
+        # păstrând ordinea găsirii
+        files_to_analyze = list({p.resolve(): p for p in files_to_analyze}.values())
+        
+        # Cele mai mari fișiere primele, pentru împărțirea muncii între procese
+        files_to_analyze.sort(key=self._file_size, reverse=True)
         
         if not files_to_analyze:
             print(f"Nu s-au găsit fișiere C/C++ în {project_path}")
@@ -264,12 +378,50 @@ class CodeComplexityAnalyzer:
         
         print(f"Analizez {len(files_to_analyze)} fișiere...")
         
-        # Analizează fiecare fișier
-        files_metrics = []
-        for filepath in files_to_analyze:
-            print(f"Analizez: {filepath.name}")
-            metrics = self.analyze_file(str(filepath))
-            files_metrics.append(metrics)
+        if not cache_file:
+            files_metrics = self._analyze_files(files_to_analyze, jobs)
+        else:
+            # Un fișier cu aceeași cale, dată a modificării și mărime nu se reanalizează
+            cache = self._load_cache(cache_file)
+            new_cache = {}
+            # Rezultatele rămân în ordinea din files_to_analyze, indiferent
+            # care fișiere sunt preluate din cache
+            files_metrics = []
+            pending = []
+            
+            for filepath in files_to_analyze:
+                key = str(filepath.resolve())
+                try:
+                    st = filepath.stat()
+                except OSError:
+                    st = None  # Ex. symlink invalid - eroarea se raportează la citire
+                entry = cache.get(key) if st else None
+                metrics = None
+                if entry and entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size:
+                    try:
+                        metrics = FileMetrics(**entry['metrics'])
+                        new_cache[key] = entry
+                    except (KeyError, TypeError):
+                        pass  # Intrare invalidă sau dintr-o versiune mai veche
+                if metrics is None:
+                    pending.append((len(files_metrics), filepath, key, st))
+                files_metrics.append(metrics)
+            
+            if len(pending) < len(files_to_analyze):
+                print(f"{len(files_to_analyze) - len(pending)} fișiere nemodificate preluate din cache")
+            
+            if pending:
+                pending_metrics = self._analyze_files([filepath for _, filepath, _, _ in pending], jobs)
+                for (index, filepath, key, st), metrics in zip(pending, pending_metrics):
+                    files_metrics[index] = metrics
+                    if st is not None:
+                        new_cache[key] = {
+                            'mtime_ns': st.st_mtime_ns,
+                            'size': st.st_size,
+                            'metrics': asdict(metrics)
+                        }
+            
+            self._save_cache(cache_file, new_cache)
         
         # Calculează metricile proiectului
         total_loc = sum(fm.lines_of_code for fm in files_metrics)
@@ -278,7 +430,7 @@ class CodeComplexityAnalyzer:
         total_functions = sum(fm.functions_count for fm in files_metrics)
         
         complexities = [fm.cyclomatic_complexity for fm in files_metrics if fm.cyclomatic_complexity > 0]
-        avg_complexity = statistics.mean(complexities) if complexities else 0
+        avg_complexity = sum(complexities) / len(complexities) if complexities else 0
         max_complexity = max(complexities) if complexities else 0
         
         return ProjectMetrics(
@@ -292,6 +444,42 @@ class CodeComplexityAnalyzer:
             files_metrics=files_metrics
         )
 
+# Analizorul folosit de un proces din pool, creat o dată de _init_worker
+_WORKER: Optional[CodeComplexityAnalyzer] = None
+
+def _init_worker():
+    """Creează analizorul procesului curent din pool"""
+    global _WORKER
+    _WORKER = CodeComplexityAnalyzer()
+
+def _analyze_one(filepath: str) -> FileMetrics:
+    """Analizează un fișier cu analizorul procesului curent"""
+    return _WORKER.analyze_file(filepath)
+
+# Clasele Bootstrap (rând, badge) pentru complexitate: <= 10, <= 20, > 20
+_COMPLEXITY_CLASSES = (
+    ("table-success", "bg-success"),
+    ("table-warning", "bg-warning"),
+    ("table-danger", "bg-danger"),
+)
+
+_FILE_ROW_TEMPLATE = """
+            <tr class="{classes[0]}">
+                <td><strong>{fm.filename}</strong></td>
+                <td>{fm.lines_of_code}</td>
+                <td>{fm.lines_of_comments}</td>
+                <td><span class="badge {classes[1]}">{fm.cyclomatic_complexity}</span></td>
+                <td>{fm.functions_count}</td>
+                <td>{fm.max_function_complexity}</td>
+                <td>{fm.average_function_complexity}</td>
+                <td>{fm.nested_depth}</td>
+            </tr>
+            """
+
+def _complexity_classes(complexity: int) -> Tuple[str, str]:
+    """Returnează clasele (rând, badge) pentru o complexitate pozitivă"""
+    return _COMPLEXITY_CLASSES[min((complexity - 1) // 10, 2)]
+
 def generate_html_report(metrics: ProjectMetrics, project_name: str = "Arduino Project") -> str:
     """Generează raportul HTML"""
     # Sortează fișierele după complexitate
@@ -313,32 +501,13 @@ def generate_html_report(metrics: ProjectMetrics, project_name: str = "Arduino P
         overall_status = "danger"
         overall_text = "RIDICATĂ"
     
-    # Generează rândurile tabelului pentru fișiere
-    files_rows = ""
-    for fm in sorted_files:
-        if fm.cyclomatic_complexity > 0:
-            if fm.cyclomatic_complexity > 20:
-                row_class = "table-danger"
-                badge_class = "bg-danger"
-            elif fm.cyclomatic_complexity > 10:
-                row_class = "table-warning"
-                badge_class = "bg-warning"
-            else:
-                row_class = "table-success"
-                badge_class = "bg-success"
-            
-            files_rows += f"""
-            <tr class="{row_class}">
-                <td><strong>{fm.filename}</strong></td>
-                <td>{fm.lines_of_code}</td>
-                <td>{fm.lines_of_comments}</td>
-                <td><span class="badge {badge_class}">{fm.cyclomatic_complexity}</span></td>
-                <td>{fm.functions_count}</td>
-                <td>{fm.max_function_complexity}</td>
-                <td>{fm.average_function_complexity}</td>
-                <td>{fm.nested_depth}</td>
-            </tr>
-            """
+    # Generează rândurile tabelului pentru fișiere - adunate într-o listă și
+    # unite o singură dată
+    files_rows = ''.join(
+        _FILE_ROW_TEMPLATE.format(fm=fm, classes=_complexity_classes(fm.cyclomatic_complexity))
+        for fm in sorted_files
+        if fm.cyclomatic_complexity > 0
+    )
     
     # Template HTML
     html_template = f"""
@@ -562,20 +731,22 @@ def generate_html_report(metrics: ProjectMetrics, project_name: str = "Arduino P
 
 def print_report(metrics: ProjectMetrics):
     """Afișează raportul de complexitate în consolă"""
-    print("\n" + "="*60)
-    print("RAPORT COMPLEXITATE PROIECT ARDUINO")
-    print("="*60)
+    # Raportul se construiește în memorie și se scrie o singură dată
+    out = []
+    out.append("\n" + "="*60)
+    out.append("RAPORT COMPLEXITATE PROIECT ARDUINO")
+    out.append("="*60)
     
-    print(f"\n📊 STATISTICI GENERALE:")
-    print(f"   Fișiere analizate: {metrics.total_files}")
-    print(f"   Linii de cod total: {metrics.total_loc}")
-    print(f"   Linii de comentarii: {metrics.total_comments}")
-    print(f"   Linii goale: {metrics.total_blank_lines}")
-    print(f"   Funcții totale: {metrics.total_functions}")
+    out.append(f"\n📊 STATISTICI GENERALE:")
+    out.append(f"   Fișiere analizate: {metrics.total_files}")
+    out.append(f"   Linii de cod total: {metrics.total_loc}")
+    out.append(f"   Linii de comentarii: {metrics.total_comments}")
+    out.append(f"   Linii goale: {metrics.total_blank_lines}")
+    out.append(f"   Funcții totale: {metrics.total_functions}")
     
-    print(f"\n🔍 COMPLEXITATE:")
-    print(f"   Complexitate medie: {metrics.average_complexity}")
-    print(f"   Complexitate maximă: {metrics.max_complexity}")
+    out.append(f"\n🔍 COMPLEXITATE:")
+    out.append(f"   Complexitate medie: {metrics.average_complexity}")
+    out.append(f"   Complexitate maximă: {metrics.max_complexity}")
     
     # Clasifica complexitatea
     if metrics.max_complexity <= 10:
@@ -585,10 +756,10 @@ def print_report(metrics: ProjectMetrics):
     else:
         complexity_level = "🔴 RIDICATĂ"
     
-    print(f"   Nivel complexitate: {complexity_level}")
+    out.append(f"   Nivel complexitate: {complexity_level}")
     
-    print(f"\n📁 DETALII FIȘIERE:")
-    print("-" * 60)
+    out.append(f"\n📁 DETALII FIȘIERE:")
+    out.append("-" * 60)
     
     # Sortează fișierele după complexitate
     sorted_files = sorted(metrics.files_metrics, key=lambda x: x.cyclomatic_complexity, reverse=True)
@@ -596,12 +767,25 @@ def print_report(metrics: ProjectMetrics):
     for fm in sorted_files:
         if fm.cyclomatic_complexity > 0:
             complexity_indicator = "🔴" if fm.cyclomatic_complexity > 20 else "🟡" if fm.cyclomatic_complexity > 10 else "🟢"
-            print(f"{complexity_indicator} {fm.filename}")
-            print(f"   LOC: {fm.lines_of_code}, Complexitate: {fm.cyclomatic_complexity}, "
-                  f"Funcții: {fm.functions_count}, Adâncime: {fm.nested_depth}")
+            out.append(f"{complexity_indicator} {fm.filename}")
+            out.append(f"   LOC: {fm.lines_of_code}, Complexitate: {fm.cyclomatic_complexity}, "
+                       f"Funcții: {fm.functions_count}, Adâncime: {fm.nested_depth}")
             if fm.functions_count > 0:
-                print(f"   Complexitate max/medie funcție: {fm.max_function_complexity}/{fm.average_function_complexity}")
-            print()
+                out.append(f"   Complexitate max/medie funcție: {fm.max_function_complexity}/{fm.average_function_complexity}")
+            out.append("")
+    
+    out.append("")
+    sys.stdout.write("\n".join(out))
+
+def _positive_int(value: str) -> int:
+    """Tipul argparse pentru --jobs: un întreg >= 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"trebuie să fie un întreg >= 1, nu '{value}'")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(description='Analizează complexitatea codului unui proiect Arduino PlatformIO')
@@ -612,6 +796,10 @@ def main():
                        help='Pragul de complexitate pentru avertismente (default: 10)')
     parser.add_argument('--project-name', '-n', default="Arduino Project",
                        help='Numele proiectului pentru raportul HTML')
+    parser.add_argument('--jobs', type=_positive_int, default=None,
+                       help='Numărul de procese pentru analiză (default: toate nucleele, 1 = serial)')
+    parser.add_argument('--cache', '-c',
+                       help='Fișier cache (ex. .arduino_analyzer_cache.json); fișierele nemodificate nu se reanalizează')
     
     args = parser.parse_args()
     
@@ -620,7 +808,7 @@ def main():
         return
     
     analyzer = CodeComplexityAnalyzer()
-    metrics = analyzer.analyze_project(args.project_path)
+    metrics = analyzer.analyze_project(args.project_path, jobs=args.jobs, cache_file=args.cache)
     
     if metrics.total_files == 0:
         print("Nu s-au găsit fișiere pentru analiză!")
@@ -642,8 +830,12 @@ def main():
     
     # Salvează în JSON dacă e solicitat
     if args.json:
-        with open(args.json, 'w', encoding='utf-8') as f:
-            json.dump(asdict(metrics), f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(args.json, 'wb') as f:
+                f.write(orjson.dumps(metrics, option=orjson.OPT_INDENT_2))
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(asdict(metrics), f, indent=2, ensure_ascii=False)
         print(f"\n💾 Rezultatele au fost salvate în {args.json}")
     
     # Generează raportul HTML dacă e solicitat
@@ -9,18 +9,74 @@ import re
 import json
 import argparse
 import datetime
+import fnmatch
+import gzip
+import heapq
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from collections import defaultdict, Counter
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from typing import Dict, List, Tuple, Set, Optional
-import matplotlib.pyplot as plt
-import matplotlib
-matplotlib.use('Agg')  # Pentru a evita probleme cu GUI
 
-@dataclass
+try:
+    import orjson  # Opțional - serializare JSON mult mai rapidă pentru raport
+except ImportError:
+    orjson = None
+
+# Pattern-uri precompilate, folosite pentru fiecare fișier analizat. Rulează pe
+# conținutul brut (bytes): \w, \s și \b se verifică ASCII, nu Unicode, mult mai rapid.
+# Funcții - numele dinaintea "(...) {": o trecere pentru funcțiile cu tip de return
+# (void, int, ...) și una pentru cele fără tip explicit (constructors, etc.).
+# Ambele sunt necesare: findall nu suprapune potrivirile, iar o '(' neînchisă
+# dintr-un comentariu face ca potrivirea fără tip să înghită antetul următor.
+# Lista de parametri e limitată, ca fișierele generate/minificate cu multe '('
+# și nicio ')' apropiată să nu fie reparcurse până la capăt de la fiecare cuvânt.
+_RE_FUNC_TYPED = re.compile(
+    rb'\b(?:void|int|float|double|bool|char|String|byte|word|long|short|unsigned)\s+(\w+)\s*\([^)]{0,4096}\)\s*\{')
+_RE_FUNC = re.compile(rb'\b(\w+)\s*\([^)]{0,4096}\)\s*\{')
+# Cuvinte cheie urmate de "(...) {" care nu sunt nume de funcții
+_NOT_FUNC_KEYWORDS = frozenset({b'if', b'for', b'while', b'switch', b'else', b'do', b'return', b'sizeof'})
+_RE_INCLUDE = re.compile(rb'#include\s*[<"]([^>"]+)[>"]')
+_RE_DEFINE = re.compile(rb'#define\s+(\w+)')
+# Toate marcajele într-o singură alternare, căutată în tot fișierul dintr-o
+# trecere; [ \t] și '.' nu trec peste '\n', deci o potrivire rămâne pe o linie
+_RE_TODO = re.compile(rb'(TODO|FIXME|HACK|BUG):?[ \t]*(.*)', re.IGNORECASE)
+
+# Șablonul raportului HTML, livrat lângă script
+_REPORT_TEMPLATE = Path(__file__).with_name('report_template.html')
+_TEMPLATE_MARKER = re.compile(r'__([A-Z]+(?:_[A-Z]+)*)__')
+
+def _write_json(f, obj):
+    """Scrie obiectul ca JSON compact direct în fișierul binar f (cu orjson dacă e instalat);
+    acceptă și dataclass-uri"""
+    if orjson is not None:
+        f.write(_script_safe(orjson.dumps(obj)))
+        return
+    # Fără orjson, listele se scriu element cu element, ca textul JSON
+    # al întregii liste să nu existe în memorie odată
+    if isinstance(obj, list):
+        f.write(b'[')
+        for i, item in enumerate(obj):
+            if i:
+                f.write(b',')
+            f.write(_script_safe(json.dumps(item, ensure_ascii=False, separators=(',', ':'), default=asdict).encode('utf-8')))
+        f.write(b']')
+    else:
+        f.write(_script_safe(json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=asdict).encode('utf-8')))
+
+def _script_safe(data: bytes) -> bytes:
+    """Face JSON-ul sigur într-un <script> inline: un '</script>' dintr-un TODO sau
+    dintr-o cale ar închide blocul; '<\\/' e tot JSON valid și înseamnă același text"""
+    return data.replace(b'</', b'<\\/')
+
+@dataclass(slots=True, frozen=True)
 class FileStats:
-    """Statistici pentru un fișier"""
+    """Statistici pentru un fișier (fără __dict__ - pot fi mii de instanțe)"""
     path: str
+    name: str
+    dir: str  # Directorul relativ la proiect ('' pentru rădăcină)
     extension: str
     total_lines: int
     code_lines: int
@@ -33,7 +89,7 @@ class FileStats:
     todos: List[str]
     last_modified: str
 
-@dataclass
+@dataclass(slots=True)
 class ProjectStats:
     """Statistici pentru întregul proiect"""
     total_files: int
@@ -52,6 +108,15 @@ class ArduinoProjectAnalyzer:
     def __init__(self, project_path: str, config_file: str = None):
         self.project_path = Path(project_path)
         self.config = self._load_config(config_file)
+        # Seturi pentru verificările făcute la fiecare intrare din director
+        self._exclude_dirs = frozenset(self.config["exclude_dirs"])
+        # Pattern-urile fără separator privesc doar numele fișierului, deci se combină
+        # într-o singură expresie compilată; celelalte rămân pe path.match
+        name_patterns = [p for p in self.config["exclude_files"] if '/' not in p and os.sep not in p]
+        self._exclude_re = re.compile('|'.join(
+            f'(?:{fnmatch.translate(os.path.normcase(p))})' for p in name_patterns)) if name_patterns else None
+        self._exclude_files = tuple(p for p in self.config["exclude_files"] if p not in name_patterns)
+        self._extensions = frozenset(self.config["extensions"])
         self.file_stats: List[FileStats] = []
         self.project_stats: Optional[ProjectStats] = None
         
@@ -81,53 +146,53 @@ class ArduinoProjectAnalyzer:
     
     def _should_exclude(self, path: Path) -> bool:
         """Verifică dacă un fișier/folder trebuie exclus"""
-        # Verifică directoarele excluse
-        for part in path.parts:
-            if part in self.config["exclude_dirs"]:
-                return True
-        
-        # Verifică fișierele excluse
-        for pattern in self.config["exclude_files"]:
-            if path.match(pattern):
-                return True
-        
-        return False
+        # Verifică directoarele excluse, apoi fișierele excluse
+        return (not self._exclude_dirs.isdisjoint(path.parts)
+                or (self._exclude_re is not None and self._exclude_re.match(os.path.normcase(path.name)) is not None)
+                or any(path.match(pattern) for pattern in self._exclude_files))
     
-    def _analyze_file_content(self, file_path: Path) -> FileStats:
-        """Analizează conținutul unui fișier"""
+    @classmethod
+    def _analyze_file_content(cls, file_path: Path, relpath: str, stat: os.stat_result) -> FileStats:
+        """Analizează conținutul unui fișier (fără stare, deci poate rula în alt proces)
+        
+        relpath și stat vin din parcurgerea directoarelor, ca fișierul să nu mai fie interogat încă o dată.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.split('\n')
+            raw = cls._read_file(file_path, stat.st_size)
         except Exception as e:
             print(f"Eroare la citirea fișierului {file_path}: {e}")
             return None
+        # Liniile se numără pe text (operațiile pe linii str sunt mai rapide),
+        # iar pattern-urile rulează direct pe bytes
+        content = raw.decode('utf-8', errors='ignore')
         
-        # Contorizare linii
-        total_lines = len(lines)
-        blank_lines = sum(1 for line in lines if not line.strip())
-        comment_lines = self._count_comment_lines(lines, file_path.suffix)
+        # Contorizare linii - o singură trecere
+        total_lines, blank_lines, comment_lines = cls._scan_lines(content, file_path.suffix)
         code_lines = total_lines - blank_lines - comment_lines
         
         # Extragere funcții
-        functions = self._extract_functions(content, file_path.suffix)
+        functions = cls._extract_functions(raw, file_path.suffix)
         
         # Extragere include-uri
-        includes = self._extract_includes(content)
+        includes = cls._extract_includes(raw)
         
         # Extragere define-uri
-        defines = self._extract_defines(content)
+        defines = cls._extract_defines(raw)
         
         # Extragere TODO/FIXME
-        todos = self._extract_todos(lines)
+        todos = cls._extract_todos(raw)
         
         # Informații fișier
-        stat = file_path.stat()
         size_bytes = stat.st_size
         last_modified = datetime.datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
         
+        # Numele și directorul se separă o singură dată, aici, nu la fiecare raport
+        dir_, _, name = relpath.rpartition(os.sep)
+        
         return FileStats(
-            path=str(file_path.relative_to(self.project_path)),
+            path=relpath,
+            name=name,
+            dir=dir_,
             extension=file_path.suffix,
             total_lines=total_lines,
             code_lines=max(0, code_lines),
@@ -141,106 +206,257 @@ class ArduinoProjectAnalyzer:
             last_modified=last_modified
         )
     
-    def _count_comment_lines(self, lines: List[str], extension: str) -> int:
-        """Numără liniile de comentarii"""
+    @staticmethod
+    def _read_file(file_path: Path, size: int) -> bytes:
+        """Citește fișierul până la EOF, cu buffer-ul dimensionat după mărimea cunoscută din stat"""
+        # Fără obiectul fișier bufferizat și fstat-ul făcut de read_bytes(). De obicei
+        # primul read aduce tot fișierul, dar os.read poate întoarce mai puțin (limita de
+        # ~2 GiB pe apel, sisteme de fișiere de rețea/FUSE), iar fișierul poate fi crescut
+        # de la stat - deci se citește până când read întoarce b''
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            chunks = []
+            received = 0
+            while chunk := os.read(fd, max(size + 1 - received, 65536)):
+                chunks.append(chunk)
+                received += len(chunk)
+        finally:
+            os.close(fd)
+        return b''.join(chunks)
+    
+    @staticmethod
+    def _scan_lines(content: str, extension: str) -> Tuple[int, int, int]:
+        """Numără liniile totale, goale și de comentarii într-o singură trecere"""
+        lines = content.split('\n')
+        blank_count = 0
         comment_count = 0
         in_multiline_comment = False
         
+        if extension not in ['.cpp', '.c', '.h', '.hpp', '.ino'] or '/' not in content:
+            # Fără comentarii posibile rămân doar liniile goale - numărate prin
+            # map/count, fără bucla de mai jos
+            return len(lines), list(map(str.strip, lines)).count(''), 0
+        
         for line in lines:
             line = line.strip()
             if not line:
+                blank_count += 1
                 continue
-                
-            if extension in ['.cpp', '.c', '.h', '.hpp', '.ino']:
-                # Comentarii multiline /* */
-                if '/*' in line and '*/' in line and not in_multiline_comment:
-                    comment_count += 1
-                elif '/*' in line:
-                    in_multiline_comment = True
-                    comment_count += 1
-                elif '*/' in line and in_multiline_comment:
+            
+            if in_multiline_comment:
+                # Comentarii multiline /* */ - linia face parte din comentariu
+                comment_count += 1
+                if '*/' in line and '/*' not in line:
                     in_multiline_comment = False
-                    comment_count += 1
-                elif in_multiline_comment:
-                    comment_count += 1
-                # Comentarii single line //
-                elif line.startswith('//'):
-                    comment_count += 1
+            elif '/' not in line:
+                continue  # Cazul cel mai des - linie de cod fără comentarii
+            elif '/*' in line:
+                comment_count += 1
+                if '*/' not in line:
+                    in_multiline_comment = True
+            # Comentarii single line //
+            elif line.startswith('//'):
+                comment_count += 1
         
-        return comment_count
+        return len(lines), blank_count, comment_count
     
-    def _extract_functions(self, content: str, extension: str) -> List[str]:
-        """Extrage numele funcțiilor din cod"""
-        functions = []
-        if extension in ['.cpp', '.c', '.ino']:
-            # Pattern pentru funcții C/C++
-            pattern = r'\b(?:void|int|float|double|bool|char|String|byte|word|long|short|unsigned)\s+(\w+)\s*\([^)]*\)\s*\{'
-            matches = re.findall(pattern, content, re.MULTILINE)
-            functions.extend(matches)
-            
-            # Pattern pentru funcții fără tip de return explicit (constructors, etc.)
-            pattern2 = r'\b(\w+)\s*\([^)]*\)\s*\{'
-            matches2 = re.findall(pattern2, content, re.MULTILINE)
-            for match in matches2:
-                if match not in ['if', 'for', 'while', 'switch'] and match not in functions:
-                    functions.append(match)
+    @staticmethod
+    def _extract_functions(content: bytes, extension: str) -> List[str]:
+        """Extrage numele funcțiilor din cod
         
-        return list(set(functions))  # Remove duplicates
+        O '(' neînchisă într-un comentariu nu ascunde funcția de pe linia următoare:
+        
+        >>> sorted(ArduinoProjectAnalyzer._extract_functions(
+        ...     b'// Reads the sensor (returns 0..1023\\nint readSensor() {', '.cpp'))
+        ['readSensor', 'sensor']
+        """
+        if extension not in ['.cpp', '.c', '.ino']:
+            return []
+        
+        # Reuniunea celor două treceri, fără duplicate; numele (ASCII) se decodează
+        # o singură dată, la final
+        functions = set(_RE_FUNC_TYPED.findall(content))
+        functions.update(match for match in _RE_FUNC.findall(content) if match not in _NOT_FUNC_KEYWORDS)
+        return [name.decode('ascii') for name in functions]
     
-    def _extract_includes(self, content: str) -> List[str]:
+    @staticmethod
+    def _extract_includes(content: bytes) -> List[str]:
         """Extrage include-urile din cod"""
-        pattern = r'#include\s*[<"]([^>"]+)[>"]'
-        return re.findall(pattern, content)
+        return [name.decode('utf-8', errors='ignore') for name in _RE_INCLUDE.findall(content)]
     
-    def _extract_defines(self, content: str) -> List[str]:
+    @staticmethod
+    def _extract_defines(content: bytes) -> List[str]:
         """Extrage define-urile din cod"""
-        pattern = r'#define\s+(\w+)'
-        return re.findall(pattern, content)
+        return [name.decode('ascii') for name in _RE_DEFINE.findall(content)]
     
-    def _extract_todos(self, lines: List[str]) -> List[str]:
-        """Extrage comentariile TODO/FIXME/HACK"""
+    @staticmethod
+    def _extract_todos(content: bytes) -> List[str]:
+        """Extrage comentariile TODO/FIXME/HACK/BUG (primul marcaj de pe fiecare linie)"""
         todos = []
-        patterns = [r'TODO:?\s*(.*)', r'FIXME:?\s*(.*)', r'HACK:?\s*(.*)', r'BUG:?\s*(.*)']
+        line_no = 1
+        pos = 0
         
-        for i, line in enumerate(lines, 1):
-            for pattern in patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    todos.append(f"Linia {i}: {match.group(0).strip()}")
+        for match in _RE_TODO.finditer(content):
+            # Numărul liniei - se numără doar '\n' de la potrivirea anterioară
+            start = match.start()
+            line_no += content.count(b'\n', pos, start)
+            pos = start
+            todo = match.group(0).strip().decode('utf-8', errors='ignore')
+            todos.append(f"Linia {line_no}: {todo}")
         
         return todos
     
-    def scan_project(self):
-        """Scanează întregul proiect"""
+    def _walk(self, dir_path, rel_dir: str = ''):
+        """Generează (cale, cale relativă, stat) pentru fișierele cu extensiile căutate,
+        fără a intra în directoarele excluse
+        
+        Ordinea e cea a rglob('*'): fișierele unui director, apoi subdirectoarele lui.
+        """
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self._exclude_dirs:
+                            subdirs.append((entry.path, rel_dir + entry.name + os.sep))
+                    elif os.path.splitext(entry.name)[1] in self._extensions and entry.is_file():
+                        # Un singur stat per fișier, refolosit pentru mărime, dată și cache
+                        yield Path(entry.path), rel_dir + entry.name, entry.stat()
+        except OSError as e:
+            print(f"Eroare la citirea directorului {dir_path}: {e}")
+            return
+        
+        for subdir, rel_subdir in subdirs:
+            yield from self._walk(subdir, rel_subdir)
+    
+    def _analyze_paths(self, files: List[tuple], jobs: Optional[int] = None) -> List[Optional[FileStats]]:
+        """Analizează fișierele date ca (cale, cale relativă, stat), serial sau în paralel
+        (None pentru cele necitite)"""
+        if not files:
+            return []
+        paths, relpaths, stats = zip(*files)
+        workers = jobs or os.cpu_count() or 1
+        
+        if workers == 1 or len(files) == 1:
+            # Serial - evită costul pornirii pool-ului de procese
+            return list(map(_analyze_file_worker, paths, relpaths, stats))
+        
+        # Fișierele sunt independente, deci se analizează în paralel;
+        # map păstrează ordinea, deci raportul nu se schimbă
+        chunksize = max(1, len(files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_analyze_file_worker, paths, relpaths, stats, chunksize=chunksize))
+    
+    def _load_cache(self, cache_file: str) -> dict:
+        """Încarcă rezultatele salvate la rularea anterioară"""
+        if not os.path.exists(cache_file):
+            return {}
+        try:
+            if orjson is not None:
+                with open(cache_file, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Eroare la citirea cache-ului {cache_file}: {e}")
+            return {}
+    
+    def _save_cache(self, cache_file: str, cache: dict):
+        """Salvează rezultatele pentru rularea următoare"""
+        # Scris într-un fișier temporar și redenumit, ca o rulare întreruptă
+        # să nu lase un cache pe jumătate scris
+        tmp_file = cache_file + '.tmp'
+        try:
+            with open(tmp_file, 'wb') as f:
+                _write_json(f, cache)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"Eroare la salvarea cache-ului {cache_file}: {e}")
+    
+    def _scan_with_cache(self, files: List[tuple], jobs: Optional[int], cache_file: str) -> List[Optional[FileStats]]:
+        """Analizează doar fișierele modificate față de cache; ordinea rămâne cea din files"""
+        # Un fișier cu aceeași cale, dată a modificării și mărime nu se reanalizează
+        cache = self._load_cache(cache_file)
+        new_cache = {}
+        results = []
+        pending = []
+        
+        for file in files:
+            _, key, st = file
+            entry = cache.get(key)
+            stats = None
+            if entry and entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size:
+                try:
+                    stats = FileStats(**entry['stats'])
+                    new_cache[key] = entry
+                except (KeyError, TypeError):
+                    pass  # Intrare invalidă sau dintr-o versiune mai veche
+            if stats is None:
+                pending.append((len(results), file))
+            results.append(stats)
+        
+        if len(pending) < len(files):
+            print(f"{len(files) - len(pending)} fișiere nemodificate preluate din cache")
+        
+        analyzed = self._analyze_paths([file for _, file in pending], jobs)
+        for (index, (_, key, st)), stats in zip(pending, analyzed):
+            results[index] = stats
+            if stats:
+                new_cache[key] = {
+                    'mtime_ns': st.st_mtime_ns,
+                    'size': st.st_size,
+                    'stats': stats  # Serializat direct, fără copia făcută de asdict()
+                }
+        
+        self._save_cache(cache_file, new_cache)
+        return results
+    
+    def scan_project(self, jobs: Optional[int] = None, cache_file: Optional[str] = None):
+        """Scanează întregul proiect
+        
+        jobs: numărul de procese folosite pentru analiză (None = toate nucleele, 1 = serial)
+        cache_file: fișier JSON cu rezultatele anterioare; fișierele nemodificate nu se reanalizează
+        """
         print(f"Scanarea proiectului: {self.project_path}")
         
-        for file_path in self.project_path.rglob('*'):
-            if file_path.is_file() and not self._should_exclude(file_path):
-                if file_path.suffix in self.config["extensions"]:
-                    file_stats = self._analyze_file_content(file_path)
-                    if file_stats:
-                        self.file_stats.append(file_stats)
+        files = [(str(file_path), relpath, st) for file_path, relpath, st in self._walk(self.project_path)
+                 if not self._should_exclude(file_path)]
+        
+        if cache_file:
+            results = self._scan_with_cache(files, jobs, cache_file)
+        else:
+            results = self._analyze_paths(files, jobs)
+        self.file_stats.extend(stats for stats in results if stats)
         
         self._calculate_project_stats()
         print(f"Analizate {len(self.file_stats)} fișiere")
     
     def _calculate_project_stats(self):
         """Calculează statisticile proiectului"""
+        # Datele pentru raport depind de file_stats, deci se reconstruiesc la nevoie
+        self.__dict__.pop('_files_data', None)
+        self.__dict__.pop('_todos_data', None)
+        
         if not self.file_stats:
             return
         
         total_files = len(self.file_stats)
-        total_lines = sum(f.total_lines for f in self.file_stats)
-        total_code_lines = sum(f.code_lines for f in self.file_stats)
-        total_comment_lines = sum(f.comment_lines for f in self.file_stats)
-        total_blank_lines = sum(f.blank_lines for f in self.file_stats)
-        total_size_bytes = sum(f.size_bytes for f in self.file_stats)
+        total_lines = total_code_lines = total_comment_lines = total_blank_lines = 0
+        total_size_bytes = functions_count = includes_count = defines_count = todos_count = 0
+        file_types = Counter()
         
-        file_types = Counter(f.extension for f in self.file_stats)
-        functions_count = sum(len(f.functions) for f in self.file_stats)
-        includes_count = sum(len(f.includes) for f in self.file_stats)
-        defines_count = sum(len(f.defines) for f in self.file_stats)
-        todos_count = sum(len(f.todos) for f in self.file_stats)
+        # O singură trecere prin fișiere pentru toate totalurile
+        for f in self.file_stats:
+            total_lines += f.total_lines
+            total_code_lines += f.code_lines
+            total_comment_lines += f.comment_lines
+            total_blank_lines += f.blank_lines
+            total_size_bytes += f.size_bytes
+            file_types[f.extension] += 1
+            functions_count += len(f.functions)
+            includes_count += len(f.includes)
+            defines_count += len(f.defines)
+            todos_count += len(f.todos)
         
         self.project_stats = ProjectStats(
             total_files=total_files,
@@ -278,123 +494,54 @@ class ArduinoProjectAnalyzer:
         # Organizează fișierele pe directoare
         dirs = defaultdict(list)
         for file_stat in self.file_stats:
-            dir_path = str(Path(file_stat.path).parent)
-            dirs[dir_path].append(file_stat)
+            dirs[file_stat.dir or '.'].append(file_stat)
         
         tree = []
         tree.append(f"📁 {self.project_path.name}/")
         
         for dir_path in sorted(dirs.keys()):
-            if dir_path != '.':
-                level = len(Path(dir_path).parts)
+            if dir_path == '.':
+                indent = "  "
+            else:
+                level = dir_path.count(os.sep) + 1
                 indent = "  " * level
-                tree.append(f"{indent}📁 {Path(dir_path).name}/")
+                tree.append(f"{indent}📁 {dir_path.rpartition(os.sep)[2]}/")
+                indent += "  "
             
             for file_stat in sorted(dirs[dir_path], key=lambda x: x.path):
-                if dir_path == '.':
-                    indent = "  "
-                else:
-                    level = len(Path(dir_path).parts) + 1
-                    indent = "  " * level
                 
                 icon = "🔧" if file_stat.extension == ".ino" else "📄"
-                tree.append(f"{indent}{icon} {Path(file_stat.path).name} "
+                tree.append(f"{indent}{icon} {file_stat.name} "
                           f"({file_stat.total_lines} linii, {file_stat.code_lines} cod)")
         
         return "\n".join(tree)
     
-    def create_visualizations(self, output_dir: Path):
-        """Creează graficele pentru raport"""
-        if not self.file_stats:
-            return []
-        
-        output_dir.mkdir(exist_ok=True)
-        charts = []
-        
-        # Grafic 1: Distribuția liniilor per fișier
-        plt.figure(figsize=(12, 6))
-        files = [Path(f.path).name for f in self.file_stats[:10]]  # Top 10
-        lines = [f.total_lines for f in self.file_stats[:10]]
-        
-        plt.bar(files, lines, color='skyblue')
-        plt.title('Top 10 Fișiere după Numărul de Linii')
-        plt.xlabel('Fișiere')
-        plt.ylabel('Numărul de Linii')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        
-        chart1_path = output_dir / 'lines_distribution.png'
-        plt.savefig(chart1_path, dpi=150, bbox_inches='tight')
-        plt.close()
-        charts.append(str(chart1_path.relative_to(output_dir)))
-        
-        # Grafic 2: Tipuri de fișiere
-        if self.project_stats and len(self.project_stats.file_types) > 1:
-            plt.figure(figsize=(8, 6))
-            extensions = list(self.project_stats.file_types.keys())
-            counts = list(self.project_stats.file_types.values())
-            
-            plt.pie(counts, labels=extensions, autopct='%1.1f%%', startangle=90)
-            plt.title('Distribuția Tipurilor de Fișiere')
-            plt.axis('equal')
-            
-            chart2_path = output_dir / 'file_types.png'
-            plt.savefig(chart2_path, dpi=150, bbox_inches='tight')
-            plt.close()
-            charts.append(str(chart2_path.relative_to(output_dir)))
-        
-        # Grafic 3: Cod vs Comentarii vs Linii goale
-        if self.project_stats:
-            plt.figure(figsize=(8, 6))
-            categories = ['Cod', 'Comentarii', 'Linii goale']
-            values = [
-                self.project_stats.total_code_lines,
-                self.project_stats.total_comment_lines,
-                self.project_stats.total_blank_lines
-            ]
-            colors = ['lightgreen', 'lightcoral', 'lightgray']
-            
-            plt.bar(categories, values, color=colors)
-            plt.title('Distribuția Tipurilor de Linii')
-            plt.ylabel('Numărul de Linii')
-            
-            chart3_path = output_dir / 'line_types.png'
-            plt.savefig(chart3_path, dpi=150, bbox_inches='tight')
-            plt.close()
-            charts.append(str(chart3_path.relative_to(output_dir)))
-        
-        return charts
-
-
-    def generate_html_report(self, output_file: str = "project_report.html"):
-        """Generează raportul HTML interactiv"""
-        if not self.file_stats or not self.project_stats:
-            print("Nu există date pentru a generate raportul")
-            return
-        
-        output_path = Path(output_file)
-        project_type = self.detect_project_type()
-        
-        # Pregătește datele pentru JavaScript
+    @cached_property
+    def _files_data(self) -> List[dict]:
+        """Datele fișierelor pentru JavaScript, construite o singură dată per scanare"""
+        # Dict-urile se construiesc direct: asdict() copiază recursiv
+        # fiecare listă și e de zeci de ori mai lent. Din liste raportul afișează
+        # doar numărul de elemente, deci nu se mai includ (TODO-urile au todosData)
         files_data = []
         for f in self.file_stats:
             files_data.append({
                 'path': f.path,
-                'name': Path(f.path).name,
+                'name': f.name,
                 'extension': f.extension,
                 'total_lines': f.total_lines,
                 'code_lines': f.code_lines,
                 'comment_lines': f.comment_lines,
                 'blank_lines': f.blank_lines,
                 'size_bytes': f.size_bytes,
-                'functions': f.functions,
-                'includes': f.includes,
-                'defines': f.defines,
-                'todos': f.todos,
+                'functions_count': len(f.functions),
+                'includes_count': len(f.includes),
                 'last_modified': f.last_modified
             })
-        
-        # Colectează toate TODO-urile
+        return files_data
+    
+    @cached_property
+    def _todos_data(self) -> List[dict]:
+        """Toate TODO-urile proiectului, cu fișierul din care provin"""
         all_todos = []
         for file_stat in self.file_stats:
             for todo in file_stat.todos:
@@ -402,713 +549,75 @@ class ArduinoProjectAnalyzer:
                     'file': file_stat.path,
                     'todo': todo
                 })
+        return all_todos
+    
+    def generate_html_report(self, output_file: str = "project_report.html", compress: bool = False):
+        """Generează raportul HTML interactiv
         
-        html_content = f"""<!DOCTYPE html>
-    <html lang="ro">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Raport Proiect Arduino - {self.project_path.name}</title>
-        <script src="https://cdnjs.cloudflare.com/ajax/libs/Chart.js/3.9.1/chart.min.js"></script>
-        <style>
-            * {{
-                margin: 0;
-                padding: 0;
-                box-sizing: border-box;
-            }}
-            
-            body {{
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                line-height: 1.6;
-                background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                min-height: 100vh;
-            }}
-            
-            .header {{
-                background: rgba(255,255,255,0.1);
-                backdrop-filter: blur(10px);
-                padding: 20px 0;
-                margin-bottom: 20px;
-                border-bottom: 1px solid rgba(255,255,255,0.2);
-            }}
-            
-            .container {{
-                max-width: 1400px;
-                margin: 0 auto;
-                padding: 0 20px;
-            }}
-            
-            .header h1 {{
-                color: white;
-                text-align: center;
-                font-size: 2.5em;
-                text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-            }}
-            
-            .nav-tabs {{
-                display: flex;
-                justify-content: center;
-                margin: 20px 0;
-                background: rgba(255,255,255,0.1);
-                border-radius: 50px;
-                padding: 5px;
-                backdrop-filter: blur(10px);
-            }}
-            
-            .nav-tab {{
-                padding: 12px 24px;
-                background: transparent;
-                border: none;
-                color: white;
-                cursor: pointer;
-                border-radius: 25px;
-                margin: 0 5px;
-                transition: all 0.3s ease;
-                font-weight: 500;
-            }}
-            
-            .nav-tab.active {{
-                background: rgba(255,255,255,0.2);
-                box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-            }}
-            
-            .nav-tab:hover {{
-                background: rgba(255,255,255,0.15);
-            }}
-            
-            .tab-content {{
-                display: none;
-                background: rgba(255,255,255,0.95);
-                border-radius: 20px;
-                padding: 30px;
-                margin: 20px 0;
-                box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-                backdrop-filter: blur(10px);
-            }}
-            
-            .tab-content.active {{
-                display: block;
-                animation: fadeIn 0.5s ease-in-out;
-            }}
-            
-            @keyframes fadeIn {{
-                from {{ opacity: 0; transform: translateY(20px); }}
-                to {{ opacity: 1; transform: translateY(0); }}
-            }}
-            
-            .stats-grid {{
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                gap: 20px;
-                margin: 30px 0;
-            }}
-            
-            .stat-card {{
-                background: linear-gradient(135deg, #667eea, #764ba2);
-                color: white;
-                padding: 25px;
-                border-radius: 15px;
-                text-align: center;
-                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-                transition: transform 0.3s ease;
-                cursor: pointer;
-            }}
-            
-            .stat-card:hover {{
-                transform: translateY(-5px);
-            }}
-            
-            .stat-number {{
-                font-size: 2.5em;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }}
-            
-            .stat-label {{
-                opacity: 0.9;
-                font-size: 1.1em;
-            }}
-            
-            .chart-container {{
-                background: white;
-                border-radius: 15px;
-                padding: 20px;
-                margin: 20px 0;
-                box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                position: relative;
-                height: 400px;
-            }}
-            
-            .files-table-container {{
-                background: white;
-                border-radius: 15px;
-                padding: 20px;
-                margin: 20px 0;
-                box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                overflow-x: auto;
-            }}
-            
-            .search-box {{
-                width: 100%;
-                padding: 12px 20px;
-                border: 2px solid #ddd;
-                border-radius: 25px;
-                font-size: 16px;
-                margin-bottom: 20px;
-                transition: border-color 0.3s ease;
-            }}
-            
-            .search-box:focus {{
-                outline: none;
-                border-color: #667eea;
-            }}
-            
-            .files-table {{
-                width: 100%;
-                border-collapse: collapse;
-            }}
-            
-            .files-table th {{
-                background: linear-gradient(135deg, #667eea, #764ba2);
-                color: white;
-                padding: 15px 10px;
-                text-align: left;
-                font-weight: 600;
-                cursor: pointer;
-                position: sticky;
-                top: 0;
-                z-index: 10;
-            }}
-            
-            .files-table td {{
-                padding: 12px 10px;
-                border-bottom: 1px solid #eee;
-            }}
-            
-            .files-table tr:nth-child(even) {{
-                background-color: #f8f9fa;
-            }}
-            
-            .files-table tr:hover {{
-                background-color: #e3f2fd;
-            }}
-            
-            .tree-structure {{
-                background: #2c3e50;
-                color: #ecf0f1;
-                padding: 25px;
-                border-radius: 15px;
-                font-family: 'Courier New', monospace;
-                white-space: pre-line;
-                overflow-x: auto;
-                box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-            }}
-            
-            .todos-container {{
-                background: white;
-                border-radius: 15px;
-                padding: 20px;
-                margin: 20px 0;
-                box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-                max-height: 500px;
-                overflow-y: auto;
-            }}
-            
-            .todo-item {{
-                background: #fff3cd;
-                border: 1px solid #ffeaa7;
-                border-radius: 8px;
-                padding: 12px;
-                margin: 10px 0;
-                transition: all 0.3s ease;
-            }}
-            
-            .todo-item:hover {{
-                background: #fff1b8;
-                transform: translateX(5px);
-            }}
-            
-            .project-info {{
-                background: linear-gradient(135deg, #00b894, #00cec9);
-                color: white;
-                padding: 25px;
-                border-radius: 15px;
-                margin: 20px 0;
-                box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-            }}
-            
-            .sort-indicator {{
-                margin-left: 5px;
-                opacity: 0.6;
-            }}
-            
-            .filter-controls {{
-                display: flex;
-                flex-wrap: wrap;
-                gap: 15px;
-                margin-bottom: 20px;
-                align-items: center;
-            }}
-            
-            .filter-select {{
-                padding: 8px 15px;
-                border: 2px solid #ddd;
-                border-radius: 20px;
-                background: white;
-                font-size: 14px;
-            }}
-            
-            .progress-bar {{
-                width: 100%;
-                height: 8px;
-                background: #e0e0e0;
-                border-radius: 4px;
-                overflow: hidden;
-                margin: 5px 0;
-            }}
-            
-            .progress-fill {{
-                height: 100%;
-                background: linear-gradient(90deg, #667eea, #764ba2);
-                transition: width 0.3s ease;
-            }}
-            
-            @media (max-width: 768px) {{
-                .nav-tabs {{
-                    flex-wrap: wrap;
-                }}
-                
-                .stats-grid {{
-                    grid-template-columns: 1fr;
-                }}
-                
-                .filter-controls {{
-                    flex-direction: column;
-                    align-items: stretch;
-                }}
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <div class="container">
-                <h1>📊 Raport Proiect Arduino</h1>
-            </div>
-        </div>
-        
-        <div class="container">
-            <div class="nav-tabs">
-                <button class="nav-tab active" onclick="showTab('overview')">📊 Prezentare</button>
-                <button class="nav-tab" onclick="showTab('charts')">📈 Grafice</button>
-                <button class="nav-tab" onclick="showTab('files')">📁 Fișiere</button>
-                <button class="nav-tab" onclick="showTab('structure')">🌳 Structură</button>
-                <button class="nav-tab" onclick="showTab('todos')">⚠️ TODO</button>
-            </div>
-            
-            <!-- Overview Tab -->
-            <div id="overview" class="tab-content active">
-                <div class="project-info">
-                    <h3>📋 Informații Proiect</h3>
-                    <p><strong>Nume:</strong> {self.project_path.name}</p>
-                    <p><strong>Locație:</strong> {self.project_path.absolute()}</p>
-                    <p><strong>Tip:</strong> {project_type.title()}</p>
-                    <p><strong>Data analizei:</strong> {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                </div>
-                
-                <div class="stats-grid">
-                    <div class="stat-card" onclick="showTab('files')">
-                        <div class="stat-number">{self.project_stats.total_files}</div>
-                        <div class="stat-label">📁 Fișiere Total</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-number">{self.project_stats.total_lines:,}</div>
-                        <div class="stat-label">📄 Linii Total</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-number">{self.project_stats.total_code_lines:,}</div>
-                        <div class="stat-label">💻 Linii de Cod</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-number">{self.project_stats.functions_count}</div>
-                        <div class="stat-label">🔧 Funcții</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-number">{self.project_stats.total_size_bytes/1024:.1f} KB</div>
-                        <div class="stat-label">💾 Mărime Total</div>
-                    </div>
-                    <div class="stat-card" onclick="showTab('todos')">
-                        <div class="stat-number">{self.project_stats.todos_count}</div>
-                        <div class="stat-label">⚠️ TODO/FIXME</div>
-                    </div>
-                </div>
-                
-                <div class="chart-container">
-                    <canvas id="overviewChart"></canvas>
-                </div>
-            </div>
-            
-            <!-- Charts Tab -->
-            <div id="charts" class="tab-content">
-                <h2>📈 Analiză Vizuală</h2>
-                <div class="chart-container">
-                    <h3>Distribuția Liniilor per Fișier</h3>
-                    <canvas id="linesChart"></canvas>
-                </div>
-                <div class="chart-container">
-                    <h3>Tipuri de Fișiere</h3>
-                    <canvas id="fileTypesChart"></canvas>
-                </div>
-                <div class="chart-container">
-                    <h3>Cod vs Comentarii vs Linii Goale</h3>
-                    <canvas id="lineTypesChart"></canvas>
-                </div>
-            </div>
-            
-            <!-- Files Tab -->
-            <div id="files" class="tab-content">
-                <div class="files-table-container">
-                    <h2>📁 Detalii Fișiere</h2>
-                    <div class="filter-controls">
-                        <input type="text" class="search-box" id="fileSearch" placeholder="🔍 Caută fișiere..." onkeyup="filterFiles()">
-                        <select class="filter-select" id="extensionFilter" onchange="filterFiles()">
-                            <option value="">Toate extensiile</option>"""
+        compress: scrie și o copie gzip a raportului (output_file + '.gz')
+        """
+        if not self.file_stats or not self.project_stats:
+            print("Nu există date pentru a generate raportul")
+            return
         
-        # Adaugă opțiunile pentru filtrul de extensii
-        for ext in sorted(self.project_stats.file_types.keys()):
-            html_content += f'<option value="{ext}">{ext}</option>'
+        output_path = Path(output_file)
+        project_type = self.detect_project_type()
         
-        html_content += f"""
-                        </select>
-                        <button class="nav-tab" onclick="sortTable()">🔄 Sortează</button>
-                    </div>
-                    
-                    <table class="files-table" id="filesTable">
-                        <thead>
-                            <tr>
-                                <th onclick="sortTableByColumn(0)">Fișier <span class="sort-indicator">↕️</span></th>
-                                <th onclick="sortTableByColumn(1)">Extensie <span class="sort-indicator">↕️</span></th>
-                                <th onclick="sortTableByColumn(2)">Total Linii <span class="sort-indicator">↕️</span></th>
-                                <th onclick="sortTableByColumn(3)">Cod <span class="sort-indicator">↕️</span></th>
-                                <th onclick="sortTableByColumn(4)">Comentarii <span class="sort-indicator">↕️</span></th>
-                                <th onclick="sortTableByColumn(5)">Funcții <span class="sort-indicator">↕️</span></th>
-                                <th onclick="sortTableByColumn(6)">Include-uri <span class="sort-indicator">↕️</span></th>
-                                <th onclick="sortTableByColumn(7)">Mărime <span class="sort-indicator">↕️</span></th>
-                            </tr>
-                        </thead>
-                        <tbody id="filesTableBody">
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-            
-            <!-- Structure Tab -->
-            <div id="structure" class="tab-content">
-                <h2>🌳 Structura Proiectului</h2>
-                <div class="tree-structure">{self.generate_tree_structure()}</div>
-            </div>
-            
-            <!-- TODOs Tab -->
-            <div id="todos" class="tab-content">
-                <h2>⚠️ TODO/FIXME Items</h2>
-                <div class="todos-container" id="todosContainer">
-                </div>
-            </div>
-        </div>
+        # Șablonul HTML/CSS/JS e un fișier static; se înlocuiesc doar marcajele __NUME__
+        try:
+            template = _REPORT_TEMPLATE.read_text(encoding='utf-8')
+        except OSError as e:
+            print(f"Eroare la citirea șablonului {_REPORT_TEMPLATE}: {e}")
+            return
         
-        <script>
-            // Date pentru JavaScript
-            const filesData = {json.dumps(files_data, ensure_ascii=False)};
-            const todosData = {json.dumps(all_todos, ensure_ascii=False)};
-            const projectStats = {json.dumps(asdict(self.project_stats), ensure_ascii=False)};
-            
-            let currentSortColumn = -1;
-            let currentSortDirection = 'asc';
-            
-            // Funcții pentru navigare prin tab-uri
-            function showTab(tabName) {{
-                // Ascunde toate tab-urile
-                document.querySelectorAll('.tab-content').forEach(tab => {{
-                    tab.classList.remove('active');
-                }});
-                
-                // Ascunde toate butoanele active
-                document.querySelectorAll('.nav-tab').forEach(btn => {{
-                    btn.classList.remove('active');
-                }});
-                
-                // Arată tab-ul selectat
-                document.getElementById(tabName).classList.add('active');
-                
-                // Activează butonul corespunzător
-                event.target.classList.add('active');
-                
-                // Inițializează graficele când tab-ul este afișat
-                if (tabName === 'charts') {{
-                    setTimeout(initCharts, 100);
-                }}
-                if (tabName === 'files') {{
-                    populateFilesTable();
-                }}
-                if (tabName === 'todos') {{
-                    populateTodos();
-                }}
-                if (tabName === 'overview') {{
-                    setTimeout(initOverviewChart, 100);
-                }}
-            }}
-            
-            // Inițializare grafice
-            function initCharts() {{
-                // Grafic linii per fișier
-                const topFiles = filesData.slice(0, 10).sort((a, b) => b.total_lines - a.total_lines);
-                
-                new Chart(document.getElementById('linesChart'), {{
-                    type: 'bar',
-                    data: {{
-                        labels: topFiles.map(f => f.name),
-                        datasets: [{{
-                            label: 'Linii de cod',
-                            data: topFiles.map(f => f.code_lines),
-                            backgroundColor: 'rgba(102, 126, 234, 0.8)',
-                            borderColor: 'rgba(102, 126, 234, 1)',
-                            borderWidth: 2
-                        }}, {{
-                            label: 'Comentarii',
-                            data: topFiles.map(f => f.comment_lines),
-                            backgroundColor: 'rgba(118, 75, 162, 0.8)',
-                            borderColor: 'rgba(118, 75, 162, 1)',
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            legend: {{
-                                position: 'top',
-                            }}
-                        }},
-                        scales: {{
-                            y: {{
-                                beginAtZero: true
-                            }}
-                        }}
-                    }}
-                }});
-                
-                // Grafic tipuri de fișiere
-                const extensions = Object.keys(projectStats.file_types);
-                const counts = Object.values(projectStats.file_types);
-                
-                new Chart(document.getElementById('fileTypesChart'), {{
-                    type: 'doughnut',
-                    data: {{
-                        labels: extensions,
-                        datasets: [{{
-                            data: counts,
-                            backgroundColor: [
-                                '#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7',
-                                '#DDA0DD', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E9'
-                            ],
-                            borderWidth: 3,
-                            borderColor: '#fff'
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            legend: {{
-                                position: 'right',
-                            }}
-                        }}
-                    }}
-                }});
-                
-                // Grafic tipuri de linii
-                new Chart(document.getElementById('lineTypesChart'), {{
-                    type: 'bar',
-                    data: {{
-                        labels: ['Cod', 'Comentarii', 'Linii goale'],
-                        datasets: [{{
-                            label: 'Numărul de linii',
-                            data: [
-                                projectStats.total_code_lines,
-                                projectStats.total_comment_lines,
-                                projectStats.total_blank_lines
-                            ],
-                            backgroundColor: ['#2ECC71', '#E74C3C', '#95A5A6'],
-                            borderColor: ['#27AE60', '#C0392B', '#7F8C8D'],
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            legend: {{
-                                display: false
-                            }}
-                        }},
-                        scales: {{
-                            y: {{
-                                beginAtZero: true
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-            
-            // Grafic pentru overview
-            function initOverviewChart() {{
-                new Chart(document.getElementById('overviewChart'), {{
-                    type: 'line',
-                    data: {{
-                        labels: filesData.slice(0, 20).map(f => f.name),
-                        datasets: [{{
-                            label: 'Complexitate (linii de cod)',
-                            data: filesData.slice(0, 20).map(f => f.code_lines),
-                            borderColor: 'rgba(102, 126, 234, 1)',
-                            backgroundColor: 'rgba(102, 126, 234, 0.1)',
-                            tension: 0.4,
-                            fill: true
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            legend: {{
-                                position: 'top',
-                            }}
-                        }},
-                        scales: {{
-                            y: {{
-                                beginAtZero: true
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-            
-            // Populare tabel fișiere
-            function populateFilesTable() {{
-                const tbody = document.getElementById('filesTableBody');
-                tbody.innerHTML = '';
-                
-                filesData.forEach(file => {{
-                    const row = tbody.insertRow();
-                    row.innerHTML = `
-                        <td>${{file.path}}</td>
-                        <td><span style="padding: 4px 8px; background: #e3f2fd; border-radius: 12px; font-size: 0.9em;">${{file.extension}}</span></td>
-                        <td>${{file.total_lines}}</td>
-                        <td>${{file.code_lines}}</td>
-                        <td>${{file.comment_lines}}</td>
-                        <td>${{file.functions.length}}</td>
-                        <td>${{file.includes.length}}</td>
-                        <td>${{(file.size_bytes / 1024).toFixed(1)}} KB</td>
-                    `;
-                    
-                    // Adaugă bara de progres pentru liniile de cod
-                    const codeCell = row.cells[3];
-                    const maxLines = Math.max(...filesData.map(f => f.code_lines));
-                    const percentage = (file.code_lines / maxLines) * 100;
-                    codeCell.innerHTML += `<div class="progress-bar"><div class="progress-fill" style="width: ${{percentage}}%"></div></div>`;
-                }});
-            }}
-            
-            // Filtrare fișiere
-            function filterFiles() {{
-                const searchTerm = document.getElementById('fileSearch').value.toLowerCase();
-                const extensionFilter = document.getElementById('extensionFilter').value;
-                const rows = document.querySelectorAll('#filesTableBody tr');
-                
-                rows.forEach(row => {{
-                    const fileName = row.cells[0].textContent.toLowerCase();
-                    const extension = row.cells[1].textContent.trim();
-                    
-                    const matchesSearch = fileName.includes(searchTerm);
-                    const matchesExtension = !extensionFilter || extension.includes(extensionFilter);
-                    
-                    row.style.display = (matchesSearch && matchesExtension) ? '' : 'none';
-                }});
-            }}
-            
-            // Sortare tabel
-            function sortTableByColumn(columnIndex) {{
-                const table = document.getElementById('filesTable');
-                const tbody = table.querySelector('tbody');
-                const rows = Array.from(tbody.querySelectorAll('tr'));
-                
-                const isNumericColumn = [2, 3, 4, 5, 6, 7].includes(columnIndex);
-                
-                if (currentSortColumn === columnIndex) {{
-                    currentSortDirection = currentSortDirection === 'asc' ? 'desc' : 'asc';
-                }} else {{
-                    currentSortDirection = 'asc';
-                    currentSortColumn = columnIndex;
-                }}
-                
-                rows.sort((a, b) => {{
-                    let aVal = a.cells[columnIndex].textContent.trim();
-                    let bVal = b.cells[columnIndex].textContent.trim();
-                    
-                    if (isNumericColumn) {{
-                        aVal = parseFloat(aVal.replace(/[^0-9.-]/g, '')) || 0;
-                        bVal = parseFloat(bVal.replace(/[^0-9.-]/g, '')) || 0;
-                        return currentSortDirection === 'asc' ? aVal - bVal : bVal - aVal;
-                    }} else {{
-                        return currentSortDirection === 'asc' ? 
-                            aVal.localeCompare(bVal) : bVal.localeCompare(aVal);
-                    }}
-                }});
-                
-                tbody.innerHTML = '';
-                rows.forEach(row => tbody.appendChild(row));
-                
-                // Actualizează indicatorii de sortare
-                document.querySelectorAll('.sort-indicator').forEach(indicator => {{
-                    indicator.textContent = '↕️';
-                }});
-                
-                const currentIndicator = table.querySelectorAll('th')[columnIndex].querySelector('.sort-indicator');
-                currentIndicator.textContent = currentSortDirection === 'asc' ? '↑' : '↓';
-            }}
-            
-            // Populare TODO-uri
-            function populateTodos() {{
-                const container = document.getElementById('todosContainer');
-                
-                if (todosData.length === 0) {{
-                    container.innerHTML = '<p style="text-align: center; color: #666; font-size: 1.2em;">🎉 Nu există TODO-uri în acest proiect!</p>';
-                    return;
-                }}
-                
-                container.innerHTML = '';
-                todosData.forEach(todo => {{
-                    const div = document.createElement('div');
-                    div.className = 'todo-item';
-                    div.innerHTML = `
-                        <strong>📁 ${{todo.file}}</strong><br>
-                        <span style="margin-left: 20px;">${{todo.todo}}</span>
-                    `;
-                    container.appendChild(div);
-                }});
-            }}
-            
-            // Inițializare la încărcarea paginii
-            document.addEventListener('DOMContentLoaded', function() {{
-                initOverviewChart();
-                populateFilesTable();
-            }});
-        </script>
-    </body>
-    </html>"""
+        values = {
+            'PROJECT_NAME': self.project_path.name,
+            'PROJECT_PATH': str(self.project_path.absolute()),
+            'PROJECT_TYPE': project_type.title(),
+            'ANALYSIS_DATE': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'TOTAL_FILES': str(self.project_stats.total_files),
+            'TOTAL_LINES': f"{self.project_stats.total_lines:,}",
+            'TOTAL_CODE_LINES': f"{self.project_stats.total_code_lines:,}",
+            'FUNCTIONS_COUNT': str(self.project_stats.functions_count),
+            'TOTAL_SIZE_KB': f"{self.project_stats.total_size_bytes/1024:.1f}",
+            'TODOS_COUNT': str(self.project_stats.todos_count),
+            'EXTENSION_OPTIONS': ''.join(f'<option value="{ext}">{ext}</option>'
+                                         for ext in sorted(self.project_stats.file_types.keys())),
+            'TREE_HTML': self.generate_tree_structure()
+        }
+        payloads = {
+            'FILES_JSON': self._files_data,
+            'TODOS_JSON': self._todos_data,
+            # Graficele primesc direct fișierele de afișat, fără sortare în browser
+            'TOP_FILES_JSON': heapq.nlargest(10, self._files_data, key=lambda f: f['total_lines']),
+            'OVERVIEW_FILES_JSON': self._files_data[:20],
+            'STATS_JSON': self.project_stats
+        }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Raportul se scrie pe bucăți, fără a-l construi întreg în memorie; datele JSON
+        # se serializează direct în fișier. split() întoarce alternativ text și nume de marcaje,
+        # iar textul inserat (căi, TODO-uri) nu mai e căutat după marcaje
+        with open(output_path, 'wb') as f:
+            for i, segment in enumerate(_TEMPLATE_MARKER.split(template)):
+                if i % 2 == 0:
+                    f.write(segment.encode('utf-8'))
+                elif segment in payloads:
+                    _write_json(f, payloads[segment])
+                else:
+                    f.write(values[segment].encode('utf-8'))
         
         print(f"Raportul HTML interactiv a fost generat: {output_path.absolute()}")
+        
+        if compress:
+            # Datele JSON se repetă mult (chei, căi), deci raportul se comprimă foarte bine
+            gz_path = output_path.with_name(output_path.name + '.gz')
+            try:
+                with open(output_path, 'rb') as src, gzip.open(gz_path, 'wb', compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst)
+                print(f"Copie comprimată: {gz_path.absolute()}")
+            except OSError as e:
+                print(f"Eroare la comprimarea raportului {gz_path}: {e}")
+
         return str(output_path.absolute())
 
 
@@ -1138,12 +647,30 @@ class ArduinoProjectAnalyzer:
         
         print("\n" + "="*60)
 
+def _analyze_file_worker(path: str, relpath: str, stat: os.stat_result) -> Optional[FileStats]:
+    """Analizează un fișier într-un proces din pool (funcție de modul, deci serializabilă)"""
+    return ArduinoProjectAnalyzer._analyze_file_content(Path(path), relpath, stat)
+
+def _positive_int(value: str) -> int:
+    """Tipul argparse pentru --jobs: un întreg >= 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"trebuie să fie un întreg >= 1, nu '{value}'")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description="Arduino Project Analyzer")
     parser.add_argument("project_path", help="Calea către proiectul Arduino")
     parser.add_argument("--config", help="Fișier de configurație JSON")
     parser.add_argument("--output", default="project_report.html", help="Fișier de ieșire HTML")
     parser.add_argument("--no-html", action="store_true", help="Nu genera raportul HTML")
+    parser.add_argument("--jobs", "-j", type=_positive_int, default=None,
+                        help="Numărul de procese pentru analiză (implicit: toate nucleele, 1 = serial)")
+    parser.add_argument("--cache", help="Fișier JSON cu rezultatele anterioare; fișierele nemodificate nu se reanalizează")
+    parser.add_argument("--compress", action="store_true", help="Scrie și o copie gzip a raportului HTML (.html.gz)")
     
     args = parser.parse_args()
     
@@ -1152,11 +679,11 @@ def main():
         return
     
     analyzer = ArduinoProjectAnalyzer(args.project_path, args.config)
-    analyzer.scan_project()
+    analyzer.scan_project(args.jobs, args.cache)
     analyzer.print_summary()
     
     if not args.no_html:
-        analyzer.generate_html_report(args.output)
+        analyzer.generate_html_report(args.output, args.compress)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file